@@ -14,15 +14,17 @@ enum SidecarCommand {
         case .checkAuth:
             return ["check-auth"]
         case .process(let filePath, let outputDir, let systemPrompt, let jobId, let additionalFiles, let sourceURLs, let deleteNotebook):
-            var args = ["process", filePath, outputDir, "--job-id", jobId]
+            // Option values are attached with "=" so argparse never mistakes a value
+            // starting with "-" (e.g. a bullet-list prompt) for an option
+            var args = ["process", filePath, outputDir, "--job-id=\(jobId)"]
             if let prompt = systemPrompt {
-                args += ["--system-prompt", prompt]
+                args.append("--system-prompt=\(prompt)")
             }
             for additionalFile in additionalFiles {
-                args += ["--source-file", additionalFile]
+                args.append("--source-file=\(additionalFile)")
             }
             for url in sourceURLs {
-                args += ["--source-url", url]
+                args.append("--source-url=\(url)")
             }
             if deleteNotebook {
                 args += ["--delete-notebook"]
@@ -33,7 +35,7 @@ enum SidecarCommand {
         case .checkStatus(let notebookId, let taskId):
             return ["check-status", notebookId, taskId]
         case .download(let notebookId, let outputDir, let fileNameStem):
-            return ["download", notebookId, outputDir, "--name", fileNameStem]
+            return ["download", notebookId, outputDir, "--name=\(fileNameStem)"]
         }
     }
 }
@@ -63,14 +65,145 @@ struct SidecarResponse: Decodable {
 }
 
 /// Manages communication with the Python sidecar process.
-/// Stateless — each `run()` call spawns an independent process, safe for concurrent use.
+/// Commands go to a long-lived sidecar daemon over a Unix socket when it is up,
+/// and otherwise spawn an independent process; either way `run()` is safe for concurrent use.
 class SidecarManager {
 
+    /// Socket the daemon listens on; must match DEFAULT_SOCKET_PATH in the sidecar
+    private static let daemonSocketPath = FileManager.default.homeDirectoryForCurrentUser
+        .appendingPathComponent(".cache/automeetsslide/sidecar.sock").path
+
+    /// Give up on the daemon after this many launches (e.g. an older sidecar without it)
+    private static let maxDaemonLaunches = 3
+
+    private var daemonProcess: Process?
+    private var daemonLaunches = 0
+
     /// Run a sidecar command and return the final response
     @MainActor
     func run(_ command: SidecarCommand, onProgress: ((SidecarResponse) -> Void)? = nil) async throws -> SidecarResponse? {
+        if let socket = SidecarManager.connectToDaemon() {
+            if let response = await runOnDaemon(socket, command: command, onProgress: onProgress) {
+                return response
+            }
+        } else {
+            startDaemonIfNeeded()
+        }
+        return try await runProcess(command, onProgress: onProgress)
+    }
+
+    /// Run a command on the daemon; nil if the request could not be sent.
+    /// Once sent, the outcome is the last response, as for a spawned process.
+    @MainActor
+    private func runOnDaemon(_ socket: FileHandle, command: SidecarCommand, onProgress: ((SidecarResponse) -> Void)?) async -> SidecarResponse?? {
+        let arguments = command.arguments
+        let request: [String: Any] = ["cmd": arguments[0], "args": Array(arguments.dropFirst())]
+        guard var requestData = try? JSONSerialization.data(withJSONObject: request) else {
+            return nil
+        }
+        requestData.append(UInt8(ascii: "\n"))
+        do {
+            try socket.write(contentsOf: requestData)
+        } catch {
+            Log.sidecar.error("Sidecar daemon request failed: \(error.localizedDescription)")
+            return nil
+        }
+
+        let state = OSAllocatedUnfairLock(initialState: (outputBuffer: Data(), lastResponse: SidecarResponse?.none, finished: false))
+
+        return await withCheckedContinuation { continuation in
+            // The daemon closes the connection when the command finishes
+            socket.readabilityHandler = { handle in
+                let data = handle.availableData
+
+                let (responses, finished) = state.withLock { state -> ([SidecarResponse], Bool) in
+                    guard !state.finished else { return ([], false) }
+                    if data.isEmpty {
+                        state.finished = true
+                        return ([], true)
+                    }
+                    state.outputBuffer.append(data)
+                    let parsed = SidecarManager.parseCompleteLines(&state.outputBuffer)
+                    if let last = parsed.last {
+                        state.lastResponse = last
+                    }
+                    return (parsed, false)
+                }
+
+                for response in responses {
+                    Task { @MainActor in
+                        onProgress?(response)
+                    }
+                }
+
+                if finished {
+                    handle.readabilityHandler = nil
+                    try? handle.close()
+                    continuation.resume(returning: .some(state.withLock { $0.lastResponse }))
+                }
+            }
+        }
+    }
+
+    /// Connect to the daemon's socket; nil if no daemon is listening.
+    private static func connectToDaemon() -> FileHandle? {
+        let fd = socket(AF_UNIX, SOCK_STREAM, 0)
+        guard fd >= 0 else { return nil }
+
+        // Report a vanished daemon as a write error instead of killing the app
+        var noSigPipe: Int32 = 1
+        setsockopt(fd, SOL_SOCKET, SO_NOSIGPIPE, &noSigPipe, socklen_t(MemoryLayout<Int32>.size))
+
+        var address = sockaddr_un()
+        address.sun_family = sa_family_t(AF_UNIX)
+        let path = Array(daemonSocketPath.utf8)
+        guard path.count < MemoryLayout.size(ofValue: address.sun_path) else {
+            close(fd)
+            return nil
+        }
+        withUnsafeMutableBytes(of: &address.sun_path) { $0.copyBytes(from: path) }
+
+        let result = withUnsafePointer(to: &address) {
+            $0.withMemoryRebound(to: sockaddr.self, capacity: 1) {
+                connect(fd, $0, socklen_t(MemoryLayout<sockaddr_un>.size))
+            }
+        }
+        guard result == 0 else {
+            close(fd)
+            return nil
+        }
+        return FileHandle(fileDescriptor: fd, closeOnDealloc: true)
+    }
+
+    /// Launch the daemon in the background; it serves commands once its socket is up
+    /// and exits by itself when the app does.
+    @MainActor
+    private func startDaemonIfNeeded() {
+        if daemonProcess?.isRunning == true || daemonLaunches >= SidecarManager.maxDaemonLaunches {
+            return
+        }
+        daemonLaunches += 1
+
+        let process = Process()
+        process.executableURL = sidecarURL
+        process.arguments = ["daemon", "--socket=\(SidecarManager.daemonSocketPath)"]
+        process.standardOutput = FileHandle.nullDevice
+        process.standardError = FileHandle.nullDevice
+        process.environment = ProcessInfo.processInfo.environment
+
+        do {
+            try process.run()
+            daemonProcess = process
+        } catch {
+            Log.sidecar.error("Failed to start sidecar daemon: \(error.localizedDescription)")
+        }
+    }
+
+    /// Run a command in a newly spawned sidecar process
+    @MainActor
+    private func runProcess(_ command: SidecarCommand, onProgress: ((SidecarResponse) -> Void)?) async throws -> SidecarResponse? {
         // Thread-safe state for concurrent access from readabilityHandler
-        let state = OSAllocatedUnfairLock(initialState: (outputBuffer: "", lastResponse: SidecarResponse?.none))
+        let state = OSAllocatedUnfairLock(initialState: (outputBuffer: Data(), lastResponse: SidecarResponse?.none))
 
         return try await withCheckedThrowingContinuation { continuation in
             let process = Process()
@@ -94,24 +227,11 @@ class SidecarManager {
                 guard !data.isEmpty else { return }
 
                 let responses = state.withLock { state -> [SidecarResponse] in
-                    state.outputBuffer += String(data: data, encoding: .utf8) ?? ""
-
-                    var parsed: [SidecarResponse] = []
-
-                    // Process complete lines
-                    while let newlineRange = state.outputBuffer.range(of: "\n") {
-                        let line = String(state.outputBuffer[..<newlineRange.lowerBound])
-                        state.outputBuffer = String(state.outputBuffer[newlineRange.upperBound...])
-
-                        guard !line.isEmpty else { continue }
-
-                        if let jsonData = line.data(using: .utf8),
-                           let response = try? JSONDecoder().decode(SidecarResponse.self, from: jsonData) {
-                            state.lastResponse = response
-                            parsed.append(response)
-                        }
+                    state.outputBuffer.append(data)
+                    let parsed = SidecarManager.parseCompleteLines(&state.outputBuffer)
+                    if let last = parsed.last {
+                        state.lastResponse = last
                     }
-
                     return parsed
                 }
 
@@ -131,15 +251,9 @@ class SidecarManager {
                 let remainingData = stdout.fileHandleForReading.readDataToEndOfFile()
                 if !remainingData.isEmpty {
                     state.withLock { state in
-                        state.outputBuffer += String(data: remainingData, encoding: .utf8) ?? ""
-                        while let newlineRange = state.outputBuffer.range(of: "\n") {
-                            let line = String(state.outputBuffer[..<newlineRange.lowerBound])
-                            state.outputBuffer = String(state.outputBuffer[newlineRange.upperBound...])
-                            guard !line.isEmpty else { continue }
-                            if let jsonData = line.data(using: .utf8),
-                               let response = try? JSONDecoder().decode(SidecarResponse.self, from: jsonData) {
-                                state.lastResponse = response
-                            }
+                        state.outputBuffer.append(remainingData)
+                        if let last = SidecarManager.parseCompleteLines(&state.outputBuffer).last {
+                            state.lastResponse = last
                         }
                     }
                 }
@@ -168,6 +282,25 @@ class SidecarManager {
         }
     }
 
+    /// Parse and remove every complete JSON line from the buffer.
+    /// Works on raw bytes so UTF-8 sequences split across pipe reads stay intact.
+    private static func parseCompleteLines(_ buffer: inout Data) -> [SidecarResponse] {
+        var parsed: [SidecarResponse] = []
+
+        while let newlineIndex = buffer.firstIndex(of: UInt8(ascii: "\n")) {
+            let line = Data(buffer[buffer.startIndex..<newlineIndex])
+            buffer.removeSubrange(buffer.startIndex...newlineIndex)
+
+            guard !line.isEmpty else { continue }
+
+            if let response = try? JSONDecoder().decode(SidecarResponse.self, from: line) {
+                parsed.append(response)
+            }
+        }
+
+        return parsed
+    }
+
     /// Get the URL to the sidecar binary
     private var sidecarURL: URL {
         // In bundled app - binary is in Contents/MacOS/
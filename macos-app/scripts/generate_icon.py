@@ -2,9 +2,18 @@
 """Generate app icon for AutoMeetsSlide by applying squircle mask to source image.
 
 Usage:
-  python scripts/generate_icon.py
+  python scripts/generate_icon.py [--force]
+
+Icons are only regenerated when the source image or this script changed since
+the last run (tracked in .icon-cache.json next to the icons); --force always
+regenerates.
 """
 
+import argparse
+import ctypes
+import hashlib
+import json
+from datetime import datetime, timezone
 from pathlib import Path
 
 from AppKit import (
@@ -12,13 +21,114 @@ from AppKit import (
     NSBezierPath,
     NSBitmapImageRep,
     NSColor,
-    NSCompositingOperationSourceOver,
     NSGraphicsContext,
     NSImage,
-    NSMakeRect,
-    NSPNGFileType,
 )
-from Foundation import NSMakeSize, NSPoint
+from Foundation import NSURL, NSData, NSMakeSize
+from Quartz import (
+    CGContextDrawImage,
+    CGContextSetInterpolationQuality,
+    CGDataProviderCopyData,
+    CGDataProviderCreateWithCFData,
+    CGImageCreate,
+    CGImageCreateWithImageInRect,
+    CGImageDestinationAddImage,
+    CGImageDestinationCreateWithURL,
+    CGImageDestinationFinalize,
+    CGImageGetBitmapInfo,
+    CGImageGetBytesPerRow,
+    CGImageGetColorSpace,
+    CGImageGetDataProvider,
+    CGImageGetHeight,
+    CGImageGetWidth,
+    CGRectMake,
+    kCGInterpolationHigh,
+    kCGRenderingIntentDefault,
+)
+
+# vImage has no PyObjC bindings, so call it through ctypes
+_accelerate = ctypes.CDLL("/System/Library/Frameworks/Accelerate.framework/Accelerate")
+
+kvImageNoError = 0
+kvImageHighQualityResampling = 32
+
+
+class vImage_Buffer(ctypes.Structure):
+    _fields_ = [
+        ("data", ctypes.c_void_p),
+        ("height", ctypes.c_ulong),
+        ("width", ctypes.c_ulong),
+        ("rowBytes", ctypes.c_size_t),
+    ]
+
+
+_accelerate.vImageScale_ARGB8888.argtypes = [
+    ctypes.POINTER(vImage_Buffer),
+    ctypes.POINTER(vImage_Buffer),
+    ctypes.c_void_p,
+    ctypes.c_uint32,
+]
+_accelerate.vImageScale_ARGB8888.restype = ctypes.c_ssize_t
+
+
+# Squircle coefficients, in multiples of the corner radius
+LIMIT_FACTOR = 1.52866483
+TOP_RIGHT_P1 = 1.52866483
+TOP_RIGHT_P2 = 1.08849323
+TOP_RIGHT_P3 = 0.86840689
+TOP_RIGHT_P4 = 0.66993427
+TOP_RIGHT_P5 = 0.63149399
+TOP_RIGHT_P6 = 0.37282392
+TOP_RIGHT_P7 = 0.16906013
+
+TOP_RIGHT_CP1 = 0.06549600
+TOP_RIGHT_CP2 = 0.07491100
+TOP_RIGHT_CP3 = 0.16905899
+TOP_RIGHT_CP4 = 0.37282401
+
+# Top-right corner as (inset from vertical edge, inset from horizontal edge):
+# the line start, then (end, control1, control2) for each of its three curves
+CORNER_LINE_START = (TOP_RIGHT_P1, 0.0)
+CORNER_CURVES = (
+    ((TOP_RIGHT_P4, TOP_RIGHT_CP1), (TOP_RIGHT_P2, 0.0), (TOP_RIGHT_P3, 0.0)),
+    ((TOP_RIGHT_CP2, TOP_RIGHT_P5), (TOP_RIGHT_P6, TOP_RIGHT_CP3), (TOP_RIGHT_P7, TOP_RIGHT_CP4)),
+    ((0.0, TOP_RIGHT_P1), (0.0, TOP_RIGHT_P3), (0.0, TOP_RIGHT_P2)),
+)
+
+# Corners in drawing order (clockwise from top-right): (on right edge, on top edge, mirrored).
+# Mirrored corners run from the vertical edge to the horizontal one, so their insets swap.
+CORNERS = (
+    (True, True, False),
+    (True, False, True),
+    (False, False, False),
+    (False, True, True),
+)
+
+
+def _squircle_segments() -> tuple:
+    """Expand the corner table into the full path, once.
+
+    Each point is (x edge index, x factor, y edge index, y factor): edge index 0/1
+    selects left/right (bottom/top) and the signed factor is multiplied by the radius.
+    Segments with one point are lines, segments with three are curves.
+    """
+    segments = []
+    for on_right, on_top, mirrored in CORNERS:
+        x_sign = -1.0 if on_right else 1.0
+        y_sign = -1.0 if on_top else 1.0
+
+        def place(x_inset, y_inset):
+            if mirrored:
+                x_inset, y_inset = y_inset, x_inset
+            return (int(on_right), x_sign * x_inset, int(on_top), y_sign * y_inset)
+
+        segments.append((place(*CORNER_LINE_START),))
+        for curve in CORNER_CURVES:
+            segments.append(tuple(place(*point) for point in curve))
+    return tuple(segments)
+
+
+SQUIRCLE_SEGMENTS = _squircle_segments()
 
 
 def create_squircle_path(x: float, y: float, width: float, height: float) -> NSBezierPath:
@@ -28,102 +138,26 @@ def create_squircle_path(x: float, y: float, width: float, height: float) -> NSB
     """
     path = NSBezierPath.bezierPath()
 
-    LIMIT_FACTOR = 1.52866483
-    TOP_RIGHT_P1 = 1.52866483
-    TOP_RIGHT_P2 = 1.08849323
-    TOP_RIGHT_P3 = 0.86840689
-    TOP_RIGHT_P4 = 0.66993427
-    TOP_RIGHT_P5 = 0.63149399
-    TOP_RIGHT_P6 = 0.37282392
-    TOP_RIGHT_P7 = 0.16906013
-
-    TOP_RIGHT_CP1 = 0.06549600
-    TOP_RIGHT_CP2 = 0.07491100
-    TOP_RIGHT_CP3 = 0.16905899
-    TOP_RIGHT_CP4 = 0.37282401
-
     corner_radius = min(width, height) * 0.22
     max_radius = min(width, height) / 2
     limited_radius = min(corner_radius, max_radius / LIMIT_FACTOR)
     r = limited_radius
 
-    left = x
-    right = x + width
-    top = y + height
-    bottom = y
-
-    path.moveToPoint_(NSPoint(left + r * TOP_RIGHT_P1, top))
-    path.lineToPoint_(NSPoint(right - r * TOP_RIGHT_P1, top))
-
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_P4, top - r * TOP_RIGHT_CP1),
-        NSPoint(right - r * TOP_RIGHT_P2, top),
-        NSPoint(right - r * TOP_RIGHT_P3, top),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_CP2, top - r * TOP_RIGHT_P5),
-        NSPoint(right - r * TOP_RIGHT_P6, top - r * TOP_RIGHT_CP3),
-        NSPoint(right - r * TOP_RIGHT_P7, top - r * TOP_RIGHT_CP4),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right, top - r * TOP_RIGHT_P1),
-        NSPoint(right, top - r * TOP_RIGHT_P3),
-        NSPoint(right, top - r * TOP_RIGHT_P2),
-    )
-
-    path.lineToPoint_(NSPoint(right, bottom + r * TOP_RIGHT_P1))
-
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_CP1, bottom + r * TOP_RIGHT_P4),
-        NSPoint(right, bottom + r * TOP_RIGHT_P2),
-        NSPoint(right, bottom + r * TOP_RIGHT_P3),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_P5, bottom + r * TOP_RIGHT_CP2),
-        NSPoint(right - r * TOP_RIGHT_CP3, bottom + r * TOP_RIGHT_P6),
-        NSPoint(right - r * TOP_RIGHT_CP4, bottom + r * TOP_RIGHT_P7),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(right - r * TOP_RIGHT_P1, bottom),
-        NSPoint(right - r * TOP_RIGHT_P3, bottom),
-        NSPoint(right - r * TOP_RIGHT_P2, bottom),
-    )
-
-    path.lineToPoint_(NSPoint(left + r * TOP_RIGHT_P1, bottom))
-
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_P4, bottom + r * TOP_RIGHT_CP1),
-        NSPoint(left + r * TOP_RIGHT_P2, bottom),
-        NSPoint(left + r * TOP_RIGHT_P3, bottom),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_CP2, bottom + r * TOP_RIGHT_P5),
-        NSPoint(left + r * TOP_RIGHT_P6, bottom + r * TOP_RIGHT_CP3),
-        NSPoint(left + r * TOP_RIGHT_P7, bottom + r * TOP_RIGHT_CP4),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left, bottom + r * TOP_RIGHT_P1),
-        NSPoint(left, bottom + r * TOP_RIGHT_P3),
-        NSPoint(left, bottom + r * TOP_RIGHT_P2),
-    )
-
-    path.lineToPoint_(NSPoint(left, top - r * TOP_RIGHT_P1))
-
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_CP1, top - r * TOP_RIGHT_P4),
-        NSPoint(left, top - r * TOP_RIGHT_P2),
-        NSPoint(left, top - r * TOP_RIGHT_P3),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_P5, top - r * TOP_RIGHT_CP2),
-        NSPoint(left + r * TOP_RIGHT_CP3, top - r * TOP_RIGHT_P6),
-        NSPoint(left + r * TOP_RIGHT_CP4, top - r * TOP_RIGHT_P7),
-    )
-    path.curveToPoint_controlPoint1_controlPoint2_(
-        NSPoint(left + r * TOP_RIGHT_P1, top),
-        NSPoint(left + r * TOP_RIGHT_P3, top),
-        NSPoint(left + r * TOP_RIGHT_P2, top),
-    )
+    xs = (x, x + width)
+    ys = (y, y + height)
+    segments = [
+        # Plain tuples are bridged to NSPoint by PyObjC without a wrapper object per point
+        [(xs[xi] + xf * r, ys[yi] + yf * r) for xi, xf, yi, yf in segment]
+        for segment in SQUIRCLE_SEGMENTS
+    ]
+
+    # Start where the last (top-left) corner ends
+    path.moveToPoint_(segments[-1][0])
+    for segment in segments:
+        if len(segment) == 1:
+            path.lineToPoint_(segment[0])
+        else:
+            path.curveToPoint_controlPoint1_controlPoint2_(*segment)
 
     path.closePath()
     return path
@@ -137,10 +171,14 @@ def load_source_image(source_path: Path) -> NSImage:
     return image
 
 
-def create_icon(source_image: NSImage, size: int = 1024) -> NSImage:
+def create_icon(source_image: NSImage, size: int = 1024) -> NSBitmapImageRep:
     """Create the app icon by applying squircle mask to source image with bevel effect."""
     from AppKit import NSCalibratedRGBColorSpace
 
+    # Decode the source into a single bitmap up front, so drawing it skips
+    # NSImage's per-draw representation selection
+    source_cgimage = NSBitmapImageRep.imageRepWithData_(source_image.TIFFRepresentation()).CGImage()
+
     # Use NSBitmapImageRep to control exact pixel dimensions (avoid Retina 2x)
     bitmap = NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
         None, size, size, 8, 4, True, False, NSCalibratedRGBColorSpace, 0, 0,
@@ -163,16 +201,18 @@ def create_icon(source_image: NSImage, size: int = 1024) -> NSImage:
     squircle_path.addClip()
 
     # Draw source image zoomed in to make the symbol larger
-    source_size = source_image.size()
+    source_width = CGImageGetWidth(source_cgimage)
+    source_height = CGImageGetHeight(source_cgimage)
     # Crop 15% from each edge of the source to zoom into the center
     crop_ratio = 0.15
-    crop_px = source_size.width * crop_ratio
-    source_image.drawInRect_fromRect_operation_fraction_(
-        NSMakeRect(margin, margin, icon_size, icon_size),
-        NSMakeRect(crop_px, crop_px, source_size.width - crop_px * 2, source_size.height - crop_px * 2),
-        NSCompositingOperationSourceOver,
-        1.0,
+    crop_px = source_width * crop_ratio
+    cropped = CGImageCreateWithImageInRect(
+        source_cgimage,
+        CGRectMake(crop_px, crop_px, source_width - crop_px * 2, source_height - crop_px * 2),
     )
+    cg_ctx = ctx.CGContext()
+    CGContextSetInterpolationQuality(cg_ctx, kCGInterpolationHigh)
+    CGContextDrawImage(cg_ctx, CGRectMake(margin, margin, icon_size, icon_size), cropped)
 
     # Restore graphics state to remove clipping
     ctx.restoreGraphicsState()
@@ -213,40 +253,85 @@ def create_icon(source_image: NSImage, size: int = 1024) -> NSImage:
 
     NSGraphicsContext.setCurrentContext_(None)
 
-    image = NSImage.alloc().initWithSize_(NSMakeSize(size, size))
-    image.addRepresentation_(bitmap)
-    return image
-
+    return bitmap
+
+
+def write_png(image, path: Path):
+    """Write a CGImage to disk as PNG."""
+    url = NSURL.fileURLWithPath_(str(path))
+    destination = CGImageDestinationCreateWithURL(url, "public.png", 1, None)
+    if destination is None:
+        raise OSError(f"Could not create PNG destination: {path}")
+    CGImageDestinationAddImage(destination, image, None)
+    if not CGImageDestinationFinalize(destination):
+        raise OSError(f"Could not write PNG: {path}")
+
+
+def scale_image(image, size: int):
+    """Resample a 32-bit CGImage to size x size pixels with vImage."""
+    src_pixels = bytes(CGDataProviderCopyData(CGImageGetDataProvider(image)))
+    src_data = ctypes.create_string_buffer(src_pixels, len(src_pixels))
+    src = vImage_Buffer(
+        ctypes.cast(src_data, ctypes.c_void_p),
+        CGImageGetHeight(image),
+        CGImageGetWidth(image),
+        CGImageGetBytesPerRow(image),
+    )
 
-def save_png(image: NSImage, path: Path, size: int, source_size: int = 1024):
-    """Save NSImage as PNG at specified pixel size."""
-    from AppKit import NSCalibratedRGBColorSpace
+    row_bytes = size * 4
+    dst_data = ctypes.create_string_buffer(row_bytes * size)
+    dst = vImage_Buffer(ctypes.cast(dst_data, ctypes.c_void_p), size, size, row_bytes)
 
-    # Create bitmap rep with exact pixel dimensions to avoid Retina scaling
-    bitmap = NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
-        None, size, size, 8, 4, True, False, NSCalibratedRGBColorSpace, 0, 0,
+    # Channel order does not matter for scaling, so RGBA data works with the ARGB8888 variant
+    error = _accelerate.vImageScale_ARGB8888(
+        ctypes.byref(src), ctypes.byref(dst), None, kvImageHighQualityResampling,
+    )
+    if error != kvImageNoError:
+        raise RuntimeError(f"vImageScale_ARGB8888 failed with error {error}")
+
+    provider = CGDataProviderCreateWithCFData(NSData.dataWithBytes_length_(dst_data.raw, len(dst_data)))
+    return CGImageCreate(
+        size, size, 8, 32, row_bytes,
+        CGImageGetColorSpace(image), CGImageGetBitmapInfo(image),
+        provider, None, True, kCGRenderingIntentDefault,
     )
-    bitmap.setSize_(NSMakeSize(size, size))
 
-    ctx = NSGraphicsContext.graphicsContextWithBitmapImageRep_(bitmap)
-    NSGraphicsContext.setCurrentContext_(ctx)
-    ctx.setImageInterpolation_(3)
 
-    image.drawInRect_fromRect_operation_fraction_(
-        NSMakeRect(0, 0, size, size),
-        NSMakeRect(0, 0, source_size, source_size),
-        NSCompositingOperationSourceOver,
-        1.0,
-    )
+def save_png(image, path: Path, size: int):
+    """Save CGImage as PNG, resampled to the specified pixel size.
+
+    Returns the resampled image so it can seed the next smaller size.
+    """
+    if CGImageGetWidth(image) != size:
+        image = scale_image(image, size)
+    write_png(image, path)
+    return image
+
+
+CACHE_FILENAME = ".icon-cache.json"
 
-    NSGraphicsContext.setCurrentContext_(None)
 
-    png_data = bitmap.representationUsingType_properties_(NSPNGFileType, None)
-    png_data.writeToFile_atomically_(str(path), True)
-    print(f"  Created: {path.name} ({size}x{size})")
+def cache_key(source_path: Path) -> str:
+    """Hash the source image together with this script, so rendering changes also regenerate."""
+    digest = hashlib.sha256(source_path.read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def icons_up_to_date(output_dir: Path, filenames: list[str], key: str) -> bool:
+    """Return True if every output exists and was generated from the same source and script."""
+    try:
+        cache = json.loads((output_dir / CACHE_FILENAME).read_text())
+    except (FileNotFoundError, ValueError):
+        return False
+    return cache.get("key") == key and all((output_dir / name).exists() for name in filenames)
 
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="regenerate even if the source is unchanged")
+    args = parser.parse_args()
+
     project_root = Path(__file__).parent.parent
     # Try both "images" and "imaes" (typo) folder names
     source_path = project_root / "images" / "appiconbase.png"
@@ -257,9 +342,6 @@ def main():
         print(f"Error: Source image not found: {source_path}")
         return 1
 
-    print(f"Loading source image: {source_path}")
-    source_image = load_source_image(source_path)
-
     output_dir = (
         project_root
         / "Sources"
@@ -267,18 +349,31 @@ def main():
         / "Assets.xcassets"
         / "AppIcon.appiconset"
     )
+
+    # macOS icon sizes: 16, 32, 128, 256, 512 at 1x and 2x
+    sizes = [16, 32, 64, 128, 256, 512, 1024]
+
+    key = cache_key(source_path)
+    outputs = [f"appicon_{size}.png" for size in sizes] + ["Contents.json"]
+    if not args.force and icons_up_to_date(output_dir, outputs, key):
+        print("Icons are up to date (source image and script unchanged). Use --force to regenerate.")
+        return 0
+
+    print(f"Loading source image: {source_path}")
+    source_image = load_source_image(source_path)
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     print("Creating icon with squircle mask...")
     icon = create_icon(source_image, 1024)
 
-    # macOS icon sizes: 16, 32, 128, 256, 512 at 1x and 2x
-    sizes = [16, 32, 64, 128, 256, 512, 1024]
-
     print("\nGenerating PNG icons...")
-    for size in sizes:
+    # Mipmap-style pyramid: each size is a 2:1 downsample of the previous one
+    image = icon.CGImage()
+    for size in sorted(sizes, reverse=True):
         output_path = output_dir / f"appicon_{size}.png"
-        save_png(icon, output_path, size)
+        image = save_png(image, output_path, size)
+        print(f"  Created: {output_path.name} ({size}x{size})")
 
     # Update Contents.json with filenames
     contents = {
@@ -297,12 +392,15 @@ def main():
         "info": {"author": "xcode", "version": 1},
     }
 
-    import json
     contents_path = output_dir / "Contents.json"
     with open(contents_path, "w") as f:
         json.dump(contents, f, indent=2)
     print(f"  Updated: Contents.json")
 
+    cache = {"key": key, "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+    with open(output_dir / CACHE_FILENAME, "w") as f:
+        json.dump(cache, f, indent=2)
+
     print("\nAll icons generated successfully!")
 
 
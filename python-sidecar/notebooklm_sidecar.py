@@ -10,12 +10,21 @@ Commands:
     process <file> <output_dir> - Full flow: upload, generate slides, download PDF
     check-status <notebook_id> <task_id> - Check generation status
     download <notebook_id> <output_dir> - Download completed slide deck PDF
+    daemon [--socket <path>] - Serve the commands above over a Unix socket
 """
 
+import argparse
 import asyncio
+import atexit
+import contextlib
+import contextvars
+import functools
 import json
 import os
 import sys
+import time
+import traceback
+from datetime import date
 from pathlib import Path
 
 
@@ -24,125 +33,395 @@ def unique_path(path: Path) -> Path:
 
     Example: slides.pdf -> slides 2.pdf -> slides 3.pdf
     """
-    if not path.exists():
+    # One directory listing instead of a stat per candidate name
+    try:
+        with os.scandir(path.parent) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        return path
+    if path.name not in existing:
         return path
     stem = path.stem
     suffix = path.suffix
     parent = path.parent
     counter = 2
     while True:
-        candidate = parent / f"{stem} {counter}{suffix}"
-        if not candidate.exists():
-            return candidate
+        name = f"{stem} {counter}{suffix}"
+        if name not in existing:
+            return parent / name
         counter += 1
 
 
+try:
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+
+# Bypass the text and buffered layers: messages are encoded once and written to the fd
+_STDOUT_FD = sys.stdout.fileno()
+
+# In daemon mode, each request routes its output to its own connection
+_line_writer = contextvars.ContextVar("line_writer", default=None)
+
+# Lines emitted in the same event loop iteration are written out together
+_pending = bytearray()
+_flush_scheduled = False
+PENDING_FLUSH_BYTES = 4096
+
+
+def _flush_stdout():
+    """Write any buffered lines to stdout."""
+    global _flush_scheduled
+    _flush_scheduled = False
+    if not _pending:
+        return
+    data = bytes(_pending)
+    _pending.clear()
+    # A pipe write can be partial when the app is slow to read
+    while data:
+        data = data[os.write(_STDOUT_FD, data):]
+
+
+atexit.register(_flush_stdout)
+
+
+def _write_line(line: bytes, terminal: bool = False):
+    """Write one encoded JSON line.
+
+    Terminal messages are flushed at once; others are flushed at the end of the
+    current event loop iteration, so a burst of progress costs a single write
+    and nothing waits behind the next await.
+    """
+    global _flush_scheduled
+
+    writer = _line_writer.get()
+    if writer is not None:
+        writer(line)
+        return
+    _pending.extend(line)
+    if terminal or len(_pending) > PENDING_FLUSH_BYTES:
+        _flush_stdout()
+        return
+    if _flush_scheduled:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _flush_stdout()
+        return
+    loop.call_soon(_flush_stdout)
+    _flush_scheduled = True
+
+
+def _write_json_line(data: dict):
+    """Encode and write one compact JSON line."""
+    _write_line(_json_dumps(data) + b"\n", data.get("status") == "done" or "error" in data)
+
+
 def emit(status: str, message: str, **kwargs):
     """Emit a JSON status message to stdout."""
-    data = {"status": status, "message": message, **kwargs}
-    print(json.dumps(data), flush=True)
+    data = {"status": status, "message": message}
+    if kwargs:
+        data.update(kwargs)
+    _write_json_line(data)
 
 
 def emit_error(message: str):
     """Emit an error message."""
-    print(json.dumps({"error": message}), flush=True)
+    _write_json_line({"error": message})
+
+
+def elapsed_ms(started: float) -> int:
+    """Milliseconds since a time.monotonic() reading."""
+    return int((time.monotonic() - started) * 1000)
 
 
-def cmd_login():
+def encode_progress(message: str, status: str = "progress") -> bytes:
+    """Encode a fixed, non-terminal status message once for emit_encoded()."""
+    return _json_dumps({"status": status, "message": message}) + b"\n"
+
+
+def emit_encoded(line: bytes):
+    """Emit a message pre-encoded by encode_progress()."""
+    _write_line(line)
+
+
+# Fixed progress messages, encoded once at import
+_MSG_OPENING_BROWSER = encode_progress("Opening browser for Google login...")
+_MSG_WAITING_FOR_LOGIN = encode_progress("Please complete Google login in the browser...", status="waiting")
+_MSG_LOGIN_DETECTED = encode_progress("Login detected, saving authentication...")
+_MSG_CHECKING_AUTH = encode_progress("Checking authentication...")
+_MSG_VALIDATING_TOKENS = encode_progress("Storage file exists, validating tokens...")
+_MSG_CONNECTING = encode_progress("Connecting to NotebookLM...")
+_MSG_GENERATING = encode_progress("Generating slide deck...")
+_MSG_WAITING_FOR_GENERATION = encode_progress("Waiting for slide generation to complete...")
+_MSG_GENERATION_COMPLETE = encode_progress("Slide generation complete!")
+_MSG_CHECKING_STATUS = encode_progress("Checking generation status...")
+_MSG_DOWNLOADING = encode_progress("Downloading slide deck...")
+
+
+def storage_state_key() -> tuple | None:
+    """Identify the current auth storage file, or None if there is none."""
+    try:
+        st = storage_state_path().stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class SharedClient:
+    """An open NotebookLMClient and the requests currently using it."""
+
+    def __init__(self, client, stack: contextlib.AsyncExitStack, storage_key: tuple | None):
+        self.client = client
+        self.stack = stack
+        self.storage_key = storage_key
+        self.users = 0
+        self.retired = False
+
+
+class DaemonClient:
+    """NotebookLMClient kept open across daemon requests, opened on first use.
+
+    The app writes and deletes the auth storage file itself (login, logout,
+    account switch), so the client is reopened whenever that file changes.
+    A replaced client is closed once the last request using it finishes.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._shared: SharedClient | None = None
+
+    @contextlib.asynccontextmanager
+    async def borrow(self):
+        """Yield the shared client for the duration of one request."""
+        shared = await self._acquire()
+        try:
+            yield shared.client
+        finally:
+            shared.users -= 1
+            if shared.retired and shared.users == 0:
+                await shared.stack.aclose()
+
+    async def _acquire(self) -> SharedClient:
+        from notebooklm.client import NotebookLMClient
+
+        async with self._lock:
+            storage_key = storage_state_key()
+            if self._shared is not None and self._shared.storage_key != storage_key:
+                await self._retire()
+            if self._shared is None:
+                stack = contextlib.AsyncExitStack()
+                client = await stack.enter_async_context(await NotebookLMClient.from_storage())
+                self._shared = SharedClient(client, stack, storage_key)
+            self._shared.users += 1
+            return self._shared
+
+    async def _retire(self):
+        shared, self._shared = self._shared, None
+        shared.retired = True
+        if shared.users == 0:
+            await shared.stack.aclose()
+
+    async def reset(self):
+        """Drop the client so the next request reloads the stored auth."""
+        async with self._lock:
+            if self._shared is not None:
+                await self._retire()
+
+
+# Set while serving in daemon mode (see serve_daemon)
+_daemon_client: DaemonClient | None = None
+
+
+@contextlib.asynccontextmanager
+async def notebooklm_client():
+    """Open a NotebookLMClient for one command, or borrow the daemon's long-lived one."""
+    if _daemon_client is not None:
+        async with _daemon_client.borrow() as client:
+            yield client
+        return
+
+    from notebooklm.client import NotebookLMClient
+
+    async with await NotebookLMClient.from_storage() as client:
+        yield client
+
+
+async def heartbeat(message: str, interval: int = 10):
+    """Emit "<message> (<elapsed>s)" progress every interval seconds until cancelled."""
+    elapsed = 0
+    while True:
+        await asyncio.sleep(interval)
+        elapsed += interval
+        emit("progress", f"{message} ({elapsed}s)")
+
+
+@functools.lru_cache(maxsize=None)
+def storage_state_path() -> Path:
+    """Return notebooklm-py's auth storage path, resolved once per process."""
+    from notebooklm.paths import get_storage_path
+
+    return get_storage_path()
+
+
+def load_storage_state(path: Path) -> dict | None:
+    """Return the saved storage state to seed a login, or None if missing or unreadable."""
+    try:
+        state = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _is_notebooklm_url(url: str) -> bool:
+    """Return True for NotebookLM pages past the Google sign-in flow."""
+    return "notebooklm.google.com" in url and "accounts.google" not in url
+
+
+async def cmd_login():
     """Open browser for Google login using Playwright."""
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        from playwright.async_api import async_playwright
     except ImportError:
         emit_error("Playwright not installed. Run: pip install playwright && playwright install chromium")
         return
 
-    from notebooklm.paths import get_browser_profile_dir, get_storage_path
-
-    storage_path = get_storage_path()
-    browser_profile = get_browser_profile_dir()
-    storage_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-    browser_profile.mkdir(parents=True, exist_ok=True, mode=0o700)
+    storage_path = storage_state_path()
+    if not storage_path.parent.is_dir():
+        storage_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
 
-    emit("progress", "Opening browser for Google login...")
+    emit_encoded(_MSG_OPENING_BROWSER)
 
-    with sync_playwright() as p:
-        # Use Playwright's bundled Chromium
-        context = p.chromium.launch_persistent_context(
-            user_data_dir=str(browser_profile),
+    async with async_playwright() as p:
+        # Use Playwright's bundled Chromium with an ephemeral profile;
+        # only the storage state is persisted, and it seeds the next login.
+        browser = await p.chromium.launch(
             headless=False,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--password-store=basic",
-            ],
+            # Google sign-in rejects browsers that report navigator.webdriver
+            args=["--disable-blink-features=AutomationControlled"],
             ignore_default_args=["--enable-automation"],
         )
+        context = await browser.new_context(storage_state=load_storage_state(storage_path))
 
-        page = context.pages[0] if context.pages else context.new_page()
-        page.goto("https://notebooklm.google.com/")
+        page = await context.new_page()
+        await page.goto("https://notebooklm.google.com/")
 
-        emit("waiting", "Please complete Google login in the browser...")
+        emit_encoded(_MSG_WAITING_FOR_LOGIN)
 
-        # Wait for successful login - detect NotebookLM homepage
-        # Poll until we're on the NotebookLM page (not login/accounts page)
+        # Wait for successful login - detect NotebookLM homepage (not login/accounts page).
+        # wait_for_url reacts to navigation events; progress runs on its own timer.
         max_wait = 300  # 5 minutes
-        poll_interval = 2
-        waited = 0
-
-        while waited < max_wait:
-            current_url = page.url
-            # Check if we're on NotebookLM (not on accounts.google.com or login page)
-            if "notebooklm.google.com" in current_url and "accounts.google" not in current_url:
-                # Additional check: look for signs we're actually logged in
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        logged_in = False
+
+        # The app only acts on the "waiting" status; this is a sign of life for logs
+        waiting = asyncio.create_task(heartbeat("Waiting for login...", interval=30))
+        try:
+            while not logged_in:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
                 try:
-                    # Wait a bit for page to settle
-                    page.wait_for_load_state("networkidle", timeout=5000)
-                    # Check if we're past the login
-                    if "accounts.google" not in page.url:
-                        emit("progress", "Login detected, saving authentication...")
-                        break
-                except:
-                    pass
-
-            page.wait_for_timeout(poll_interval * 1000)
-            waited += poll_interval
-            if waited % 10 == 0:
-                emit("progress", f"Waiting for login... ({waited}s)")
+                    await page.wait_for_url(_is_notebooklm_url, timeout=remaining * 1000)
+                except PlaywrightTimeoutError:
+                    break
 
-        if waited >= max_wait:
+                try:
+                    # Let the page finish parsing so a redirect back to sign-in shows up.
+                    # networkidle rarely settles on Google pages that keep polling.
+                    await page.wait_for_load_state("domcontentloaded", timeout=5000)
+                except PlaywrightTimeoutError:
+                    pass
+                # Check if we're past the login
+                if "accounts.google" not in page.url:
+                    emit_encoded(_MSG_LOGIN_DETECTED)
+                    logged_in = True
+        finally:
+            waiting.cancel()
+
+        if not logged_in:
             emit_error("Login timeout. Please try again.")
-            context.close()
+            await browser.close()
             return
 
-        context.storage_state(path=str(storage_path))
+        await context.storage_state(path=str(storage_path))
         storage_path.chmod(0o600)
-        context.close()
+        await browser.close()
 
     emit("done", f"Authentication saved to: {storage_path}")
 
 
+CACHE_DIR = Path.home() / ".cache" / "automeetsslide"
+
+# Touched after each successful token validation in check-auth
+AUTH_STAMP_PATH = CACHE_DIR / "auth-validated"
+
+# Storage older than this is always revalidated
+TOKEN_TTL_SECONDS = 14 * 24 * 60 * 60
+
+
+def auth_recently_validated(storage_stat: os.stat_result) -> bool:
+    """Return True if the stored auth was fully validated today and hasn't changed since.
+
+    Storage past TOKEN_TTL_SECONDS, or rewritten after the last validation,
+    always needs a full check.
+    """
+    if time.time() - storage_stat.st_mtime > TOKEN_TTL_SECONDS:
+        return False
+    try:
+        validated_at = AUTH_STAMP_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return validated_at >= storage_stat.st_mtime and date.fromtimestamp(validated_at) == date.today()
+
+
 async def cmd_check_auth():
     """Check if user is authenticated."""
-    emit("progress", "Checking authentication...")
+    emit_encoded(_MSG_CHECKING_AUTH)
 
-    from notebooklm.paths import get_storage_path
-    storage_path = get_storage_path()
+    storage_path = storage_state_path()
     emit("progress", f"Storage path: {storage_path}")
 
-    if not storage_path.exists():
+    try:
+        storage_stat = storage_path.stat()
+    except FileNotFoundError:
         emit("error", f"Storage file not found: {storage_path}", authenticated=False)
         return
 
-    emit("progress", "Storage file exists, validating tokens...")
+    if storage_stat.st_size == 0:
+        emit("error", f"Storage file is empty: {storage_path}", authenticated=False)
+        return
+
+    # Fast path: skip loading tokens if they were validated earlier today
+    if auth_recently_validated(storage_stat):
+        emit("done", "Authenticated", authenticated=True)
+        return
+
+    emit_encoded(_MSG_VALIDATING_TOKENS)
 
     try:
         from notebooklm.auth import AuthTokens
         auth = await AuthTokens.from_storage()
         emit("progress", f"Tokens loaded: csrf={auth.csrf_token[:10]}..., session={auth.session_id[:10]}...")
-        emit("done", "Authenticated", authenticated=True)
     except Exception as e:
         emit("error", f"Authentication check failed: {type(e).__name__}: {e}", authenticated=False)
+        return
+
+    try:
+        AUTH_STAMP_PATH.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        AUTH_STAMP_PATH.touch()
+    except OSError:
+        pass  # Only costs a full check next time
+    emit("done", "Authenticated", authenticated=True)
 
 
+DEFAULT_SOCKET_PATH = CACHE_DIR / "sidecar.sock"
+
 DEFAULT_SYSTEM_PROMPT = "この内容から包括的なスライドデッキを日本語で作成してください。"
 
 
@@ -165,8 +444,6 @@ async def cmd_process(
         additional_files: Additional source file paths (optional)
         source_urls: Web/Google Doc URLs to add as sources (optional)
     """
-    from notebooklm.client import NotebookLMClient
-
     file_path = Path(file_path)
     output_dir = Path(output_dir)
 
@@ -176,51 +453,72 @@ async def cmd_process(
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    emit("progress", "Connecting to NotebookLM...")
+    # Check additional files before connecting; missing ones are skipped, not fatal
+    extra_files = []
+    for af_path in (additional_files or []):
+        af = Path(af_path)
+        if not af.exists():
+            emit("progress", f"Skipping missing file: {af}")
+            continue
+        extra_files.append(af)
+
+    emit_encoded(_MSG_CONNECTING)
 
     try:
-        async with await NotebookLMClient.from_storage() as client:
+        async with notebooklm_client() as client:
             # Create notebook
-            emit("progress", "Creating notebook...")
+            started = time.monotonic()
             title = f"Auto Slide: {file_path.name} [{job_id}]" if job_id else f"Auto Slide: {file_path.name}"
             notebook = await client.notebooks.create(title)
             notebook_id = notebook.id
-            emit("progress", f"Notebook created: {notebook_id}", notebook_id=notebook_id)
-
-            # Add primary source
-            emit("progress", f"Uploading source: {file_path.name}...")
-            source = await client.sources.add_file(notebook_id, str(file_path))
-            emit("progress", f"Source uploaded: {source.id}")
-            source_ids = [(source.id, file_path.name)]
-
-            # Add additional file sources
-            for af_path in (additional_files or []):
-                af = Path(af_path)
-                if not af.exists():
-                    emit("progress", f"Skipping missing file: {af}")
-                    continue
-                emit("progress", f"Uploading additional source: {af.name}...")
-                af_source = await client.sources.add_file(notebook_id, str(af))
-                emit("progress", f"Additional source uploaded: {af_source.id}")
-                source_ids.append((af_source.id, af.name))
-
-            # Add URL sources
+            emit("phase", "notebook_created", notebook_id=notebook_id, elapsed_ms=elapsed_ms(started))
+
+            # Collect sources: primary file, additional files, then URLs
+            sources = [(file_path.name, client.sources.add_file, str(file_path))]
+            for af in extra_files:
+                sources.append((af.name, client.sources.add_file, str(af)))
             for url in (source_urls or []):
-                emit("progress", f"Adding URL source: {url}...")
-                url_source = await client.sources.add_url(notebook_id, url)
-                emit("progress", f"URL source added: {url_source.id}")
-                source_ids.append((url_source.id, url))
+                sources.append((url, client.sources.add_url, url))
+
+            # Upload all sources concurrently; results are reported in input order
+            started = time.monotonic()
+            uploaded = await asyncio.gather(
+                *(add(notebook_id, target) for _, add, target in sources),
+                return_exceptions=True,
+            )
+            source_ids = []
+            for (sname, _, _), result in zip(sources, uploaded):
+                if isinstance(result, BaseException):
+                    raise result
+                source_ids.append((result.id, sname))
+            emit(
+                "phase",
+                "sources_uploaded",
+                notebook_id=notebook_id,
+                source_ids=[sid for sid, _ in source_ids],
+                elapsed_ms=elapsed_ms(started),
+            )
 
             # Wait for all sources to be processed
-            for sid, sname in source_ids:
-                emit("progress", f"Waiting for source to be processed: {sname}...")
-                ready_source = await client.sources.wait_until_ready(
+            async def wait_until_ready(sid: str):
+                # Report each source as soon as it is ready, not after the slowest one
+                source = await client.sources.wait_until_ready(
                     notebook_id, sid, timeout=300.0  # 5 minutes for audio
                 )
-                emit("progress", f"Source ready: {ready_source.title}")
+                emit("progress", f"Source ready: {source.title}")
+
+            for _, sname in source_ids:
+                emit("progress", f"Waiting for source to be processed: {sname}...")
+            ready_sources = await asyncio.gather(
+                *(wait_until_ready(sid) for sid, _ in source_ids),
+                return_exceptions=True,
+            )
+            for result in ready_sources:
+                if isinstance(result, BaseException):
+                    raise result
 
             # Generate slides
-            emit("progress", "Generating slide deck...")
+            emit_encoded(_MSG_GENERATING)
             instructions = system_prompt or DEFAULT_SYSTEM_PROMPT
             status = await client.artifacts.generate_slide_deck(
                 notebook_id,
@@ -233,17 +531,20 @@ async def cmd_process(
             emit("progress", f"Generation started, task_id: {status.task_id}", task_id=status.task_id, notebook_id=notebook_id)
 
             # Wait for completion
-            emit("progress", "Waiting for slide generation to complete...")
+            emit_encoded(_MSG_WAITING_FOR_GENERATION)
             final_status = await client.artifacts.wait_for_completion(
                 notebook_id,
                 status.task_id,
+                # Poll quickly at first so short generations return promptly
+                initial_interval=0.5,
+                max_interval=8.0,
                 timeout=1800.0  # 30 minutes max
             )
 
             if final_status.is_failed:
                 emit("progress", f"Generation status reports failed (status={final_status.status}), attempting download anyway...")
             else:
-                emit("progress", "Slide generation complete!")
+                emit_encoded(_MSG_GENERATION_COMPLETE)
 
             # Download PDF
             output_file = unique_path(output_dir / f"{file_path.stem}_slides.pdf")
@@ -268,18 +569,15 @@ async def cmd_process(
     except FileNotFoundError as e:
         emit_error(f"Not authenticated. Run 'login' first. ({e})")
     except Exception as e:
-        import traceback
         emit_error(f"Process failed: {type(e).__name__}: {e}\n{traceback.format_exc()}")
 
 
 async def cmd_find_notebook(job_id: str):
     """Find an existing notebook by job ID and return its status."""
-    from notebooklm.client import NotebookLMClient
-
     emit("progress", f"Searching for notebook with job ID: {job_id}")
 
     try:
-        async with await NotebookLMClient.from_storage() as client:
+        async with notebooklm_client() as client:
             notebooks = await client.notebooks.list()
             for nb in notebooks:
                 if job_id in nb.title:
@@ -310,12 +608,10 @@ async def cmd_find_notebook(job_id: str):
 
 async def cmd_check_status(notebook_id: str, task_id: str):
     """Check the generation status of a task."""
-    from notebooklm.client import NotebookLMClient
-
-    emit("progress", "Checking generation status...")
+    emit_encoded(_MSG_CHECKING_STATUS)
 
     try:
-        async with await NotebookLMClient.from_storage() as client:
+        async with notebooklm_client() as client:
             status = await client.artifacts.poll_status(notebook_id, task_id)
             emit("done", f"Status: {status.status}",
                  generation_status=status.status,
@@ -330,15 +626,13 @@ async def cmd_check_status(notebook_id: str, task_id: str):
 
 async def cmd_download(notebook_id: str, output_dir: str, name: str | None = None, artifact_id: str | None = None):
     """Download a completed slide deck PDF."""
-    from notebooklm.client import NotebookLMClient
-
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    emit("progress", "Downloading slide deck...")
+    emit_encoded(_MSG_DOWNLOADING)
 
     try:
-        async with await NotebookLMClient.from_storage() as client:
+        async with notebooklm_client() as client:
             file_name = f"{name}_slides.pdf" if name else "slides.pdf"
             output_file = unique_path(output_dir / file_name)
             downloaded_path = await client.artifacts.download_slide_deck(
@@ -350,97 +644,184 @@ async def cmd_download(notebook_id: str, output_dir: str, name: str | None = Non
     except FileNotFoundError as e:
         emit_error(f"Not authenticated. Run 'login' first. ({e})")
     except Exception as e:
-        import traceback
         emit_error(f"Download failed: {type(e).__name__}: {e}\n{traceback.format_exc()}")
 
 
-def main():
-    if len(sys.argv) < 2:
-        emit_error("No command provided. Use: login, check-auth, process, check-status, or download")
-        return
+class ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that reports usage errors as JSON on stdout."""
 
-    command = sys.argv[1]
+    def error(self, message: str):
+        emit_error(f"{message}\n{self.format_usage().strip()}")
+        sys.exit(2)
 
-    if command == "login":
-        # Login is synchronous (uses sync_playwright)
-        cmd_login()
 
-    elif command == "check-auth":
-        asyncio.run(cmd_check_auth())
+def build_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="notebooklm-cli", description="NotebookLM sidecar for AutoMeetsSlide")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
 
-    elif command == "process":
-        if len(sys.argv) < 4:
-            emit_error("Usage: process <file_path> <output_dir> [--system-prompt <prompt>] [--source-file <path>]... [--source-url <url>]...")
-            return
-        file_path = sys.argv[2]
-        output_dir = sys.argv[3]
-
-        # Parse --system-prompt flag
-        system_prompt = None
-        if "--system-prompt" in sys.argv:
-            idx = sys.argv.index("--system-prompt")
-            if idx + 1 < len(sys.argv):
-                system_prompt = sys.argv[idx + 1]
-
-        # Parse --job-id flag
-        job_id = None
-        if "--job-id" in sys.argv:
-            idx = sys.argv.index("--job-id")
-            if idx + 1 < len(sys.argv):
-                job_id = sys.argv[idx + 1]
-
-        # Parse --source-file flags (can appear multiple times)
-        additional_files = []
-        for i, arg in enumerate(sys.argv):
-            if arg == "--source-file" and i + 1 < len(sys.argv):
-                additional_files.append(sys.argv[i + 1])
-
-        # Parse --source-url flags (can appear multiple times)
-        source_urls = []
-        for i, arg in enumerate(sys.argv):
-            if arg == "--source-url" and i + 1 < len(sys.argv):
-                source_urls.append(sys.argv[i + 1])
-
-        # Parse --delete-notebook flag
-        delete_notebook = "--delete-notebook" in sys.argv
-
-        asyncio.run(cmd_process(file_path, output_dir, system_prompt, job_id, additional_files or None, source_urls or None, delete_notebook))
-
-    elif command == "find-notebook":
-        if len(sys.argv) < 3:
-            emit_error("Usage: find-notebook <job_id>")
-            return
-        asyncio.run(cmd_find_notebook(sys.argv[2]))
+    commands.add_parser("login", help="Open browser for Google login")
+    commands.add_parser("check-auth", help="Check if authenticated")
 
-    elif command == "check-status":
-        if len(sys.argv) < 4:
-            emit_error("Usage: check-status <notebook_id> <task_id>")
-            return
-        asyncio.run(cmd_check_status(sys.argv[2], sys.argv[3]))
+    process = commands.add_parser("process", help="Upload, generate slides, download PDF")
+    process.add_argument("file_path")
+    process.add_argument("output_dir")
+    process.add_argument("--system-prompt")
+    process.add_argument("--job-id")
+    process.add_argument("--source-file", dest="additional_files", action="append")
+    process.add_argument("--source-url", dest="source_urls", action="append")
+    process.add_argument("--delete-notebook", action="store_true")
+
+    find_notebook = commands.add_parser("find-notebook", help="Find a notebook by job ID")
+    find_notebook.add_argument("job_id")
+
+    check_status = commands.add_parser("check-status", help="Check generation status")
+    check_status.add_argument("notebook_id")
+    check_status.add_argument("task_id")
+
+    download = commands.add_parser("download", help="Download completed slide deck PDF")
+    download.add_argument("notebook_id")
+    download.add_argument("output_dir")
+    download.add_argument("--name")
+    download.add_argument("--artifact-id")
+
+    daemon = commands.add_parser("daemon", help="Serve commands over a Unix socket")
+    daemon.add_argument("--socket", default=str(DEFAULT_SOCKET_PATH))
+
+    return parser
+
+
+async def dispatch(args: argparse.Namespace):
+    """Run a parsed command."""
+    if args.command == "login":
+        await cmd_login()
+
+    elif args.command == "check-auth":
+        await cmd_check_auth()
+
+    elif args.command == "process":
+        await cmd_process(
+            args.file_path,
+            args.output_dir,
+            args.system_prompt,
+            args.job_id,
+            args.additional_files,
+            args.source_urls,
+            args.delete_notebook,
+        )
+
+    elif args.command == "find-notebook":
+        await cmd_find_notebook(args.job_id)
+
+    elif args.command == "check-status":
+        await cmd_check_status(args.notebook_id, args.task_id)
 
-    elif command == "download":
-        if len(sys.argv) < 4:
-            emit_error("Usage: download <notebook_id> <output_dir> [--name <stem>] [--artifact-id <id>]")
+    elif args.command == "download":
+        await cmd_download(args.notebook_id, args.output_dir, args.name, args.artifact_id)
+
+
+async def _handle_daemon_connection(reader, writer):
+    """Run the connection's single request and stream its output back."""
+    _line_writer.set(writer.write)
+    try:
+        try:
+            request = json.loads(await reader.readline())
+            argv = [request["cmd"], *request.get("args", [])]
+            if not all(isinstance(arg, str) for arg in argv):
+                raise TypeError("cmd and args must be strings")
+        except (ValueError, KeyError, TypeError) as e:
+            emit_error(f"Invalid daemon request: {e}")
+        else:
+            try:
+                args = build_parser().parse_args(argv)
+            except SystemExit:
+                pass  # ArgumentParser.error already emitted the usage error
+            else:
+                if args.command == "daemon":
+                    emit_error("Already running as a daemon")
+                else:
+                    try:
+                        await dispatch(args)
+                    except Exception as e:
+                        emit_error(f"{args.command} failed: {type(e).__name__}: {e}\n{traceback.format_exc()}")
+                    if args.command == "login":
+                        await _daemon_client.reset()
+        await writer.drain()
+    except ConnectionError:
+        pass  # Client went away; nothing left to report to
+    finally:
+        writer.close()
+
+
+async def watch_parent(stop, interval: float = 5.0):
+    """Set stop once the process that started the daemon has exited."""
+    parent = os.getppid()
+    while os.getppid() == parent:
+        await asyncio.sleep(interval)
+    stop.set()
+
+
+async def serve_daemon(socket_path: str):
+    """Serve commands over a Unix socket from one long-lived process.
+
+    Each connection sends one request line, {"cmd": <command>, "args": [<arg>, ...]},
+    and receives the same JSON lines the command prints when run directly; the
+    connection is closed when the command finishes. The NotebookLM client (auth,
+    HTTP connection pool) is reused across requests. The daemon stops on
+    SIGINT/SIGTERM or when its parent (the app) exits.
+    """
+    import signal
+
+    global _daemon_client
+
+    socket_path = Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+    if socket_path.exists():
+        try:
+            _, probe = await asyncio.open_unix_connection(str(socket_path))
+        except OSError:
+            socket_path.unlink()  # Stale socket left by a previous daemon
+        else:
+            probe.close()
+            emit_error(f"Daemon already running: {socket_path}")
             return
-        notebook_id = sys.argv[2]
-        output_dir = sys.argv[3]
 
-        name = None
-        if "--name" in sys.argv:
-            idx = sys.argv.index("--name")
-            if idx + 1 < len(sys.argv):
-                name = sys.argv[idx + 1]
+    _daemon_client = DaemonClient()
+    server = await asyncio.start_unix_server(_handle_daemon_connection, path=str(socket_path))
+    socket_path.chmod(0o600)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    watcher = asyncio.create_task(watch_parent(stop))
 
-        artifact_id = None
-        if "--artifact-id" in sys.argv:
-            idx = sys.argv.index("--artifact-id")
-            if idx + 1 < len(sys.argv):
-                artifact_id = sys.argv[idx + 1]
+    emit("ready", f"Listening on: {socket_path}", socket_path=str(socket_path))
 
-        asyncio.run(cmd_download(notebook_id, output_dir, name, artifact_id))
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        watcher.cancel()
+        await _daemon_client.reset()
+        _daemon_client = None
+        socket_path.unlink(missing_ok=True)
+
+    emit("done", "Daemon stopped")
+
+
+def main():
+    args = build_parser().parse_args()
+
+    try:
+        from uvloop import run
+    except ImportError:
+        from asyncio import run
 
+    if args.command == "daemon":
+        run(serve_daemon(args.socket))
     else:
-        emit_error(f"Unknown command: {command}")
+        run(dispatch(args))
 
 
 if __name__ == "__main__":